@@ -14,6 +14,7 @@ from .iros import collect_iros_papers
 from .cvpr import collect_cvpr_papers
 from .iccv import collect_iccv_papers
 from .siggraph import collect_siggraph_papers
+from .all import collect_all
 from .search import collect_google_paper_titles
 from .title_filter import filter_papers_by_keywords
 
@@ -29,6 +30,7 @@ __all__ = [
     'collect_cvpr_papers',
     'collect_iccv_papers',
     'collect_siggraph_papers',
+    'collect_all',
     'collect_google_paper_titles',
     'filter_papers_by_keywords'
 ]
@@ -0,0 +1,56 @@
+"""
+多会议并发收集
+CoRL / ICLR / ICML / ICRA / IROS 都依赖 DBLP 网络请求，彼此独立，可以并发执行
+"""
+
+import asyncio
+import logging
+from typing import Callable, Dict, List
+
+from .corl import collect_corl_papers
+from .iclr import collect_iclr_papers
+from .icml import collect_icml_papers
+from .icra import collect_icra_papers
+from .iros import collect_iros_papers
+
+logger = logging.getLogger(__name__)
+
+DBLP_CONFERENCE_COLLECTORS: Dict[str, Callable[[int], List[Dict[str, str]]]] = {
+    "corl": collect_corl_papers,
+    "iclr": collect_iclr_papers,
+    "icml": collect_icml_papers,
+    "icra": collect_icra_papers,
+    "iros": collect_iros_papers,
+}
+
+
+def collect_all(year: int = 2024) -> Dict[str, List[Dict[str, str]]]:
+    """
+    并发收集 CoRL / ICLR / ICML / ICRA / IROS 论文标题
+
+    Args:
+        year: 会议年份
+
+    Returns:
+        {来源名: 论文列表}，某个会议失败时对应列表为空
+    """
+    return asyncio.run(collect_all_async(year))
+
+
+async def collect_all_async(year: int = 2024) -> Dict[str, List[Dict[str, str]]]:
+    """collect_all 的异步实现，每个收集器在线程中运行，总耗时约等于最慢的一个会议"""
+    names = list(DBLP_CONFERENCE_COLLECTORS)
+    results = await asyncio.gather(
+        *(asyncio.to_thread(DBLP_CONFERENCE_COLLECTORS[name], year) for name in names),
+        return_exceptions=True,
+    )
+
+    collected: Dict[str, List[Dict[str, str]]] = {}
+    for name, result in zip(names, results):
+        if isinstance(result, BaseException):
+            logger.error("Failed to collect %s %s papers: %s", name.upper(), year, result)
+            collected[name] = []
+        else:
+            collected[name] = result
+
+    return collected
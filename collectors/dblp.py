@@ -3,15 +3,28 @@ DBLP 辅助工具
 提供从 DBLP API 获取会议论文标题的通用方法
 """
 
+import asyncio
 import logging
 import re
 from typing import List, Dict
 
 import requests
-from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser
+
+from http_session import build_cached_session
 
 logger = logging.getLogger(__name__)
 
+DBLP_API_URL = "https://dblp.org/search/publ/api"
+DBLP_PAGE_SIZE = 1000
+# 同时向 DBLP 发起的分页请求上限（每页请求在线程中通过带缓存的会话发出）
+DBLP_MAX_CONCURRENCY = 8
+
+_TAG_RE = re.compile(r"<[^>]+>")
+_WS_RE = re.compile(r"\s+")
+
+_SESSION = build_cached_session(["https://dblp.org"])
+
 
 def fetch_dblp_papers(
     venue_key: str,
@@ -32,72 +45,122 @@ def fetch_dblp_papers(
         论文列表，每项包含 {title, url, source}
     """
 
-    base_url = "https://dblp.org/search/publ/api"
+    try:
+        return asyncio.run(
+            _fetch_dblp_papers_async(venue_key, year, source_label, max_rows)
+        )
+    except Exception as exc:  # pragma: no cover - 防御性
+        logger.error("Unexpected error when fetching DBLP data: %s", exc)
+        return []
+
+
+async def _fetch_dblp_papers_async(
+    venue_key: str,
+    year: int,
+    source_label: str,
+    max_rows: int = 5000,
+) -> List[Dict[str, str]]:
+    """
+    异步分页拉取 DBLP 数据：先请求第一页拿到 @total，再并发请求剩余页
+    """
+
+    query = f"toc:{venue_key}/{year}"
     papers: List[Dict[str, str]] = []
-    offset = 0
-    page_size = 1000
 
     try:
-        while offset < max_rows:
-            params = {
-                "q": f"toc:{venue_key}/{year}",
-                "format": "json",
-                "h": min(page_size, max_rows - offset),
-                "f": offset,
-            }
-
-            response = requests.get(base_url, params=params, timeout=30)
-            response.raise_for_status()
+        first_page = await asyncio.to_thread(
+            _fetch_dblp_page, query, 0, min(DBLP_PAGE_SIZE, max_rows)
+        )
+    except requests.exceptions.RequestException as exc:
+        logger.error("Failed to fetch DBLP data for %s %s: %s", venue_key, year, exc)
+        return papers
 
-            data = response.json()
-            hits = data.get("result", {}).get("hits", {})
-            total = int(hits.get("@total", 0))
-            entries = hits.get("hit", [])
+    hits = first_page.get("result", {}).get("hits", {})
+    total = int(hits.get("@total", 0))
+    papers.extend(_parse_dblp_hits(hits, source_label))
 
-            if not entries:
-                break
+    limit = min(total, max_rows)
+    offsets = list(range(DBLP_PAGE_SIZE, limit, DBLP_PAGE_SIZE))
 
-            if isinstance(entries, dict):
-                entries = [entries]
+    if papers and offsets:
+        semaphore = asyncio.Semaphore(DBLP_MAX_CONCURRENCY)
 
-            for entry in entries:
-                info = entry.get("info", {})
-                raw_title = info.get("title", "")
-                title = _clean_dblp_title(raw_title)
+        async def _bounded(offset: int) -> Dict:
+            async with semaphore:
+                return await asyncio.to_thread(
+                    _fetch_dblp_page, query, offset, min(DBLP_PAGE_SIZE, limit - offset)
+                )
 
-                if not title:
-                    continue
+        pages = await asyncio.gather(
+            *(_bounded(offset) for offset in offsets),
+            return_exceptions=True,
+        )
 
-                url = info.get("ee") or info.get("url") or ""
-                papers.append(
-                    {
-                        "title": title,
-                        "url": url,
-                        "source": source_label,
-                    }
+        # gather 保持顺序，结果与串行分页一致
+        for offset, page in zip(offsets, pages):
+            if isinstance(page, BaseException):
+                logger.error(
+                    "Failed to fetch DBLP page (offset=%d) for %s %s: %s",
+                    offset,
+                    venue_key,
+                    year,
+                    page,
                 )
+                continue
+            page_hits = page.get("result", {}).get("hits", {})
+            papers.extend(_parse_dblp_hits(page_hits, source_label))
 
-            offset += page_size
+    if not papers:
+        logger.warning(
+            "DBLP returned no entries for %s %s. Check if proceedings are published.",
+            venue_key,
+            year,
+        )
 
-            if offset >= total:
-                break
+    logger.info("Collected %d papers from DBLP for %s %s", len(papers), venue_key, year)
+    return _deduplicate(papers)
 
-        if not papers:
-            logger.warning(
-                "DBLP returned no entries for %s %s. Check if proceedings are published.",
-                venue_key,
-                year,
-            )
 
-        logger.info("Collected %d papers from DBLP for %s %s", len(papers), venue_key, year)
-        return _deduplicate(papers)
+def _fetch_dblp_page(query: str, offset: int, size: int) -> Dict:
+    """请求 DBLP API 的一页结果（走带本地缓存的会话，重复运行直接命中缓存）"""
+    params = {
+        "q": query,
+        "format": "json",
+        "h": size,
+        "f": offset,
+    }
 
-    except requests.exceptions.RequestException as exc:
-        logger.error("Failed to fetch DBLP data for %s %s: %s", venue_key, year, exc)
-        return papers
-    except Exception as exc:  # pragma: no cover - 防御性
-        logger.error("Unexpected error when fetching DBLP data: %s", exc)
-        return papers
+    response = _SESSION.get(DBLP_API_URL, params=params, timeout=30)
+    response.raise_for_status()
+    return response.json()
+
+
+def _parse_dblp_hits(hits: Dict, source_label: str) -> List[Dict[str, str]]:
+    """把 DBLP API 返回的 hits 转换为论文列表"""
+    entries = hits.get("hit", [])
+
+    if isinstance(entries, dict):
+        entries = [entries]
+
+    papers: List[Dict[str, str]] = []
+    for entry in entries:
+        info = entry.get("info", {})
+        raw_title = info.get("title", "")
+        title = _clean_dblp_title(raw_title)
+
+        if not title:
+            continue
+
+        url = info.get("ee") or info.get("url") or ""
+        papers.append(
+            {
+                "title": title,
+                "url": url,
+                "source": source_label,
+            }
+        )
+
+    return papers
 
 
 def build_dblp_conf_page_url(conf_slug: str, year: int) -> str:
@@ -113,31 +176,33 @@ def fetch_dblp_papers_from_html(html_url: str, source_label: str) -> List[Dict[s
     papers: List[Dict[str, str]] = []
 
     try:
-        response = requests.get(html_url, timeout=30)
+        response = _SESSION.get(html_url, timeout=30)
         response.raise_for_status()
     except requests.exceptions.RequestException as exc:
         logger.error("Failed to fetch DBLP HTML page %s: %s", html_url, exc)
         return papers
 
-    soup = BeautifulSoup(response.text, "html.parser")
+    tree = LexborHTMLParser(response.text)
 
-    entries = soup.find_all(
-        "li", class_=lambda value: value and "entry" in value
-    ) or soup.select("li")
+    entries = tree.css("li.entry") or tree.css("li")
 
     for entry in entries:
-        title_tag = entry.find(class_="title")
-        if not title_tag:
+        title_node = entry.css_first(".title")
+        if title_node is None:
             continue
 
-        title = _clean_dblp_title(title_tag.get_text(" ", strip=True))
+        title = _clean_dblp_title(title_node.text(separator=" ", strip=True))
         if not title:
             continue
 
         url = ""
-        link_tag = entry.select_one("li.ee a[href]") or entry.find("a", href=True)
-        if link_tag and link_tag.get("href") and not link_tag["href"].startswith("#"):
-            url = link_tag["href"]
+        link_node = entry.css_first("li.ee a[href]")
+        if link_node is None:
+            link_node = entry.css_first("a[href]")
+        if link_node is not None:
+            href = link_node.attributes.get("href")
+            if href and not href.startswith("#"):
+                url = href
 
         papers.append(
             {
@@ -161,22 +226,18 @@ def _clean_dblp_title(title: str) -> str:
         return ""
 
     # DBLP title 可能包含 HTML 标签，例如 <span class="title">...</span>
-    title = re.sub(r"<[^>]+>", " ", title)
-    title = re.sub(r"\s+", " ", title)
+    title = _TAG_RE.sub(" ", title)
+    title = _WS_RE.sub(" ", title)
     return title.strip()
 
 
 def _deduplicate(papers: List[Dict[str, str]]) -> List[Dict[str, str]]:
-    """按标题去重"""
-    seen = set()
-    unique: List[Dict[str, str]] = []
+    """按标题去重（dict 保持插入顺序，保留每个标题第一次出现的记录）"""
+    seen: Dict[str, Dict[str, str]] = {}
 
     for paper in papers:
         normalized = paper["title"].lower()
-        if normalized in seen:
-            continue
-        seen.add(normalized)
-        unique.append(paper)
-
-    return unique
+        if normalized not in seen:
+            seen[normalized] = paper
 
+    return list(seen.values())
@@ -114,6 +114,14 @@ REQUEST_TIMEOUT = 30  # 秒
 MAX_RETRIES = 3
 RATE_LIMIT_DELAY = 1  # 秒
 
+# HTTP 响应缓存（DBLP / arXiv / OpenAlex），重复运行时直接命中本地缓存
+HTTP_CACHE_PATH = DATA_DIR / "http_cache.sqlite"
+HTTP_CACHE_EXPIRE_AFTER = {
+    "dblp.org": 24 * 3600,
+    "export.arxiv.org": 6 * 3600,
+    "api.openalex.org": 6 * 3600,
+}
+
 # PDF处理配置
 MAX_PDF_SIZE_MB = 50  # 最大PDF大小（MB）
 OCR_ENABLED = os.getenv("OCR_ENABLED", "true").lower() == "true"
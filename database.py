@@ -12,6 +12,12 @@ from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# papers 表的全部列，用于校验调用方传入的列名（列名会直接拼进 SQL）
+PAPER_COLUMNS = frozenset({
+    "id", "title", "arxiv_id", "pdf_url", "authors", "abstract",
+    "published_date", "source", "status", "created_at",
+})
+
 
 class Database:
     """数据库操作类"""
@@ -77,7 +83,9 @@ class Database:
             
             # 创建索引以提高查询性能
             conn.execute("CREATE INDEX IF NOT EXISTS idx_papers_status ON papers(status)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_papers_status_created ON papers(status, created_at DESC)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_papers_source ON papers(source)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_papers_title ON papers(title)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_analysis_paper_id ON analysis_results(paper_id)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_detail_failures_time ON detail_failures(failed_at)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_download_failures_time ON download_failures(failed_at)")
@@ -188,6 +196,51 @@ class Database:
             rows = cursor.fetchall()
             return [dict(row) for row in rows]
     
+    def get_papers_by_statuses(
+        self,
+        statuses: List[str],
+        per_status_limit: int,
+        columns: Optional[List[str]] = None,
+    ) -> List[Dict]:
+        """
+        一次查询获取多个状态的论文，每个状态最多返回 per_status_limit 篇（按创建时间倒序）
+        
+        Args:
+            statuses: 论文状态列表
+            per_status_limit: 每个状态的返回数量限制
+            columns: 需要返回的列，默认只取列表页需要的列；包含 papers 表不存在的列时抛出 ValueError
+            
+        Returns:
+            论文列表（按状态、创建时间倒序排列，包含 status 列，调用方可按状态分组）
+        """
+        if not statuses:
+            return []
+
+        columns = list(columns or ["id", "title", "arxiv_id", "source", "status", "created_at"])
+        if "status" not in columns:
+            columns.append("status")
+        unknown = [column for column in columns if column not in PAPER_COLUMNS]
+        if unknown:
+            raise ValueError(f"Unknown papers columns: {unknown}")
+
+        column_clause = ", ".join(columns)
+        placeholders = ", ".join("?" for _ in statuses)
+        query = f"""
+            SELECT {column_clause} FROM (
+                SELECT *, ROW_NUMBER() OVER (
+                    PARTITION BY status ORDER BY created_at DESC
+                ) AS rn
+                FROM papers WHERE status IN ({placeholders})
+            ) WHERE rn <= ?
+            ORDER BY status, created_at DESC
+        """
+
+        with sqlite3.connect(self.db_path) as conn:
+            conn.row_factory = sqlite3.Row
+            cursor = conn.execute(query, [*statuses, per_status_limit])
+            rows = cursor.fetchall()
+            return [dict(row) for row in rows]
+    
     def update_paper_status(self, paper_id: str, status: str) -> bool:
         """更新论文状态"""
         try:
@@ -4,17 +4,65 @@
 参考Reference/tools/paper/中的实现
 """
 
+import asyncio
 import logging
 import requests
-import xml.etree.ElementTree as ET
 import re
 import time
-import difflib
-from typing import Dict, List, Optional
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+import aiohttp
+from lxml import etree
+from rapidfuzz import fuzz, process
 from tqdm import tqdm
 
+from http_session import build_cached_session
+
 logger = logging.getLogger(__name__)
 
+ARXIV_API_URL = "http://export.arxiv.org/api/query"
+OPENALEX_API_URL = "https://api.openalex.org/works"
+
+# 批量获取时每个站点的并发请求上限（arXiv 限流严格，只允许少量并发）
+ARXIV_MAX_CONCURRENCY = 2
+OPENALEX_MAX_CONCURRENCY = 16
+# 批量获取时相邻两次 arXiv 请求的最小间隔（秒），与 scripts/fetch_paper_info.py 的节奏一致
+ARXIV_REQUEST_INTERVAL = 3.0
+# 被 arXiv 限流后的退避时间（秒，按重试次数递增）和最多重试次数
+ARXIV_RATE_LIMIT_BACKOFF = 60.0
+ARXIV_RATE_LIMIT_RETRIES = 3
+
+# arXiv 关键词搜索（策略2）至少需要的关键词数，太短的查询过于宽泛
+ARXIV_KEYWORD_MIN_TOKENS = 4
+
+# 增量解析 arXiv 响应时每次喂给解析器的字节数
+ARXIV_STREAM_CHUNK_SIZE = 64 * 1024
+
+_SESSION = build_cached_session([
+    'http://export.arxiv.org',
+    'https://export.arxiv.org',
+    'https://api.openalex.org',
+])
+
+_STOPWORDS_RE = re.compile(r'\b(a|an|the|and|or|of|for|in|on|at|to|with|by|from)\b')
+_PUNCT_RE = re.compile(r'[^\w\s]')
+# 新式 arXiv ID（YYMM.NNNN / YYMM.NNNNN），匹配时自动去掉版本号后缀
+_ARXIV_ID_RE = re.compile(r'(\d{4}\.\d{4,5})')
+# 任意 URL 中的 ID 必须锚定在 arxiv.org 上，否则 DOI 等链接里的数字会被误判
+_ARXIV_URL_RE = re.compile(r'arxiv\.org/(?:abs/|pdf/)?' + _ARXIV_ID_RE.pattern)
+
+# arXiv Atom 解析用的 XPath，在模块加载时编译一次
+_ARXIV_NS = {'atom': 'http://www.w3.org/2005/Atom',
+             'arxiv': 'http://arxiv.org/schemas/atom'}
+_ATOM_ENTRY_TAG = '{http://www.w3.org/2005/Atom}entry'
+_XP_ID = etree.XPath('string(atom:id)', namespaces=_ARXIV_NS)
+_XP_TITLE = etree.XPath('string(atom:title)', namespaces=_ARXIV_NS)
+_XP_AUTHORS = etree.XPath('atom:author/atom:name/text()', namespaces=_ARXIV_NS)
+_XP_SUMMARY = etree.XPath('string(atom:summary)', namespaces=_ARXIV_NS)
+_XP_PUBLISHED = etree.XPath('string(atom:published)', namespaces=_ARXIV_NS)
+
 
 class RateLimitError(Exception):
     """Raised when arXiv returns rate-limit responses."""
@@ -60,42 +108,142 @@ def fetch_paper_info(title: str, url: str = None) -> Optional[Dict]:
         return None
 
 
+class _ThrottledSession:
+    """批量获取时对单个站点的 aiohttp 会话：限制并发数，并保证相邻请求之间的最小间隔"""
+
+    def __init__(self, session: aiohttp.ClientSession, max_concurrency: int, min_interval: float = 0.0):
+        self.session = session
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._lock = asyncio.Lock()
+        self._min_interval = min_interval
+        self._next_start = 0.0
+
+    def pause(self, seconds: float) -> None:
+        """被限流时整体暂停：之后的所有请求至少等待 seconds 秒"""
+        now = asyncio.get_running_loop().time()
+        self._next_start = max(self._next_start, now + seconds)
+
+    @asynccontextmanager
+    async def get(self, url: str, params: Dict):
+        # 先拿到并发名额再发请求，ClientTimeout 只从真正发出请求时开始计时，排队时间不计入
+        async with self._semaphore:
+            async with self._lock:
+                loop = asyncio.get_running_loop()
+                while (wait := self._next_start - loop.time()) > 0:
+                    await asyncio.sleep(wait)
+                self._next_start = loop.time() + self._min_interval
+            async with self.session.get(url, params=params) as resp:
+                yield resp
+
+
 def batch_fetch_papers(papers: List[Dict], show_progress: bool = True) -> List[Dict]:
     """
     批量获取论文信息
+
+    各论文之间并发请求 arXiv / OpenAlex，每个站点的并发数分别受限；
+    arXiv 请求之间保持最小间隔，被限流时整体退避后重试。
     
     Args:
         papers: 论文列表，每个元素应包含'title'字段，可选'url'字段
         show_progress: 是否显示进度条
         
     Returns:
-        获取到信息的论文列表
+        获取到信息的论文列表（顺序与输入一致）
     """
-    results = []
-    
-    iterator = tqdm(papers, desc="Fetching papers") if show_progress else papers
-    
-    for paper in iterator:
-        title = paper.get('title')
-        url = paper.get('url')
-        
-        if not title:
-            continue
-        
-        try:
-            info = fetch_paper_info(title, url)
-            
+    results = asyncio.run(_batch_fetch_papers_async(papers, show_progress))
+
+    logger.info(f"Successfully fetched {len(results)}/{len(papers)} papers")
+    return results
+
+
+async def _batch_fetch_papers_async(papers: List[Dict], show_progress: bool) -> List[Dict]:
+    """batch_fetch_papers 的异步实现"""
+    timeout = aiohttp.ClientTimeout(total=30)
+    arxiv_connector = aiohttp.TCPConnector(limit_per_host=ARXIV_MAX_CONCURRENCY)
+    openalex_connector = aiohttp.TCPConnector(limit_per_host=OPENALEX_MAX_CONCURRENCY)
+
+    async with aiohttp.ClientSession(connector=arxiv_connector, timeout=timeout) as session_arxiv, \
+            aiohttp.ClientSession(connector=openalex_connector, timeout=timeout) as session_oa:
+        arxiv = _ThrottledSession(session_arxiv, ARXIV_MAX_CONCURRENCY, ARXIV_REQUEST_INTERVAL)
+        openalex = _ThrottledSession(session_oa, OPENALEX_MAX_CONCURRENCY)
+
+        async def _fetch_one(index: int, paper: Dict) -> Tuple[int, Optional[Dict]]:
+            title = paper.get('title')
+            attempt = 0
+            while True:
+                try:
+                    info = await _fetch_paper_info_async(arxiv, openalex, title, paper.get('url'))
+                    break
+                except RateLimitError as rl_err:
+                    if attempt >= ARXIV_RATE_LIMIT_RETRIES:
+                        logger.error(f"Giving up on '{title}' after repeated arXiv rate limits: {rl_err}")
+                        return index, None
+                    attempt += 1
+                    backoff = ARXIV_RATE_LIMIT_BACKOFF * attempt
+                    logger.warning(
+                        "arXiv rate limited (status=%s), pausing arXiv requests for %.0f seconds before retrying %r",
+                        rl_err.status_code,
+                        backoff,
+                        title,
+                    )
+                    arxiv.pause(backoff)
+                except Exception as e:
+                    logger.error(f"Error fetching paper '{title}': {e!r}")
+                    return index, None
+
             if info:
                 # 添加原始source信息
                 info['source'] = paper.get('source', 'unknown')
-                results.append(info)
-            
-        except Exception as e:
-            logger.error(f"Error fetching paper '{title}': {e}")
-            continue
-    
-    logger.info(f"Successfully fetched {len(results)}/{len(papers)} papers")
-    return results
+            return index, info
+
+        tasks = [
+            asyncio.ensure_future(_fetch_one(index, paper))
+            for index, paper in enumerate(papers)
+            if paper.get('title')
+        ]
+
+        completed = asyncio.as_completed(tasks)
+        if show_progress:
+            completed = tqdm(completed, total=len(tasks), desc="Fetching papers")
+
+        found: Dict[int, Dict] = {}
+        for next_done in completed:
+            index, info = await next_done
+            if info:
+                found[index] = info
+
+    return [found[index] for index in sorted(found)]
+
+
+async def _fetch_paper_info_async(
+    arxiv: _ThrottledSession,
+    openalex: _ThrottledSession,
+    title: str,
+    url: str = None,
+) -> Optional[Dict]:
+    """fetch_paper_info 的异步版本，供批量获取使用"""
+    if url:
+        result = _extract_from_url(title, url)
+        if result and result.get('arxiv_id'):
+            return result
+
+    arxiv_results = await _search_arxiv_async(arxiv, title)
+    best = _pick_best_match(title, [r for r in arxiv_results if r], source_name="arXiv")
+
+    if not best:
+        keyword_results = await _search_arxiv_keywords_async(arxiv, title)
+        best = _pick_best_match(title, [r for r in keyword_results if r], source_name="arXiv")
+
+    if not (best and best.get("pdf_url")):
+        openalex_results = await _search_openalex_async(openalex, title)
+        best = _pick_best_match(title, [r for r in openalex_results if r], source_name="OpenAlex")
+
+    if best and best.get("pdf_url"):
+        logger.info(f"✓ Found paper: {best.get('title')}")
+        return best
+
+    logger.warning(f"✗ Could not find paper: {title}")
+    return None
 
 
 def _combined_search(title: str, max_results_per_source: int = 10) -> Optional[Dict]:
@@ -108,6 +256,13 @@ def _combined_search(title: str, max_results_per_source: int = 10) -> Optional[D
 
     # 先在 arXiv 里选一个与标题最相似的结果
     best_from_arxiv = _pick_best_match(title, arxiv_candidates, source_name="arXiv")
+
+    # 精确标题搜索没有可靠匹配时，才退回到关键词搜索
+    if not best_from_arxiv:
+        keyword_results = _search_arxiv_keywords(title, max_results_per_source)
+        keyword_candidates = [r for r in keyword_results if r]
+        best_from_arxiv = _pick_best_match(title, keyword_candidates, source_name="arXiv")
+
     if best_from_arxiv and best_from_arxiv.get("pdf_url"):
         return best_from_arxiv
 
@@ -123,8 +278,9 @@ def _combined_search(title: str, max_results_per_source: int = 10) -> Optional[D
     return None
 
 
+@lru_cache(maxsize=4096)
 def _normalize_title(text: str) -> str:
-    """简单归一化标题：小写 + 压缩空白"""
+    """简单归一化标题：小写 + 压缩空白（同一标题会在多个来源间反复比较，故缓存）"""
     if not text:
         return ""
     return " ".join(text.lower().split())
@@ -136,7 +292,7 @@ def _title_similarity(query_title: str, candidate_title: str) -> float:
     c = _normalize_title(candidate_title)
     if not q or not c:
         return 0.0
-    return difflib.SequenceMatcher(None, q, c).ratio()
+    return fuzz.ratio(q, c) / 100.0
 
 
 def _pick_best_match(
@@ -151,19 +307,21 @@ def _pick_best_match(
     if not candidates:
         return None
 
-    best = None
-    best_score = 0.0
+    q = _normalize_title(query_title)
+    if not q:
+        return None
 
-    for cand in candidates:
-        cand_title = cand.get("title", "") or ""
-        score = _title_similarity(query_title, cand_title)
-        if score > best_score:
-            best_score = score
-            best = cand
+    choices = [_normalize_title(cand.get("title", "") or "") for cand in candidates]
 
-    if not best:
+    # 不设 score_cutoff：低于阈值时仍需要最佳分数来输出诊断日志
+    match = process.extractOne(q, choices, scorer=fuzz.ratio)
+    if not match or match[1] <= 0:
         return None
 
+    _, score, index = match
+    best = candidates[index]
+    best_score = score / 100.0
+
     logger.info(
         "Best %s match for %r is %r (similarity=%.3f)",
         source_name,
@@ -188,112 +346,136 @@ def _pick_best_match(
 
 def _search_arxiv(title: str, max_results: int = 10) -> List[Dict]:
     """
-    使用arXiv API搜索论文
+    使用arXiv API搜索论文（策略1：精确标题搜索）
     参考Reference/tools/paper/search_openalex.py中的实现
     """
-    base_url = "http://export.arxiv.org/api/query"
+    results = _query_arxiv(_arxiv_title_query(title), max_results)
+    logger.info(f"Found {len(results)} results from arXiv")
+    return results
 
-    def _request(params):
-        try:
-            resp = requests.get(base_url, params=params, timeout=30)
-            resp.raise_for_status()
-            return resp
-        except requests.exceptions.HTTPError as exc:
-            status = exc.response.status_code if exc.response else None
-            if status in (429, 443, 503):
-                raise RateLimitError(status) from exc
-            raise
 
+def _search_arxiv_keywords(title: str, max_results: int = 10) -> List[Dict]:
+    """
+    arXiv 策略2：关键词搜索，仅在策略1没有可靠匹配时调用
+    关键词太少时查询过于宽泛，基本不可能命中，直接跳过以省下一次请求
+    """
+    keywords = _arxiv_keywords(title)
+    if len(keywords.split()) < ARXIV_KEYWORD_MIN_TOKENS:
+        logger.info(f"Skipping arXiv keyword search, too few keywords: {keywords!r}")
+        return []
+
+    results = _query_arxiv(f'all:{keywords}', max_results)
+    logger.info(f"Found {len(results)} results from arXiv (keywords)")
+    return results
+
+
+def _query_arxiv(search_query: str, max_results: int) -> List[Dict]:
+    """执行一次 arXiv API 查询并解析结果"""
     try:
-        # 策略1：精确标题搜索
-        query = f'ti:"{title}"'
-        params = {
-            'search_query': query,
-            'start': 0,
-            'max_results': max_results,
-            'sortBy': 'relevance',
-            'sortOrder': 'descending'
-        }
+        resp = _SESSION.get(ARXIV_API_URL, params=_arxiv_params(search_query, max_results), timeout=30)
+        resp.raise_for_status()
+        return _parse_arxiv_response(resp.content)
+    except requests.exceptions.HTTPError as exc:
+        status = exc.response.status_code if exc.response is not None else None
+        if status in (429, 443, 503):
+            raise RateLimitError(status) from exc
+        logger.error(f"Error searching arXiv: {exc}")
+        return []
+    except Exception as e:
+        logger.error(f"Error searching arXiv: {e}")
+        return []
 
-        response = _request(params)
-        results = _parse_arxiv_response(response.content)
 
-        if results:
-            logger.info(f"Found {len(results)} results from arXiv")
-            return results
+async def _search_arxiv_async(
+    session: _ThrottledSession,
+    title: str,
+    max_results: int = 10,
+) -> List[Dict]:
+    """_search_arxiv 的异步版本"""
+    results = await _query_arxiv_async(session, _arxiv_title_query(title), max_results)
+    logger.info(f"Found {len(results)} results from arXiv")
+    return results
 
-        # 策略2：关键词搜索
-        keywords = re.sub(r'\b(a|an|the|and|or|of|for|in|on|at|to|with|by|from)\b', '', title.lower())
-        keywords = re.sub(r'[^\w\s]', ' ', keywords)
-        keywords = ' '.join(keywords.split())
 
-        query2 = f'all:{keywords}'
-        params['search_query'] = query2
+async def _search_arxiv_keywords_async(
+    session: _ThrottledSession,
+    title: str,
+    max_results: int = 10,
+) -> List[Dict]:
+    """_search_arxiv_keywords 的异步版本"""
+    keywords = _arxiv_keywords(title)
+    if len(keywords.split()) < ARXIV_KEYWORD_MIN_TOKENS:
+        logger.info(f"Skipping arXiv keyword search, too few keywords: {keywords!r}")
+        return []
+
+    results = await _query_arxiv_async(session, f'all:{keywords}', max_results)
+    logger.info(f"Found {len(results)} results from arXiv (keywords)")
+    return results
 
-        response2 = _request(params)
-        results = _parse_arxiv_response(response2.content)
-        logger.info(f"Found {len(results)} results from arXiv (keywords)")
-        return results
 
+async def _query_arxiv_async(
+    session: _ThrottledSession,
+    search_query: str,
+    max_results: int,
+) -> List[Dict]:
+    """_query_arxiv 的异步版本"""
+    try:
+        async with session.get(ARXIV_API_URL, _arxiv_params(search_query, max_results)) as resp:
+            if resp.status in (429, 443, 503):
+                raise RateLimitError(resp.status)
+            resp.raise_for_status()
+
+            # 边接收边解析：每收到一块数据就喂给解析器，不先缓冲完整响应体
+            parser = _new_arxiv_parser()
+            results: List[Dict] = []
+            async for chunk in resp.content.iter_chunked(ARXIV_STREAM_CHUNK_SIZE):
+                parser.feed(chunk)
+                _drain_arxiv_entries(parser, results)
+            parser.close()
+            _drain_arxiv_entries(parser, results)
+            return results
     except RateLimitError:
         raise
     except Exception as e:
-        logger.error(f"Error searching arXiv: {e}")
+        logger.error(f"Error searching arXiv: {e!r}")
         return []
 
 
+def _arxiv_params(search_query: str, max_results: int) -> Dict:
+    """构造 arXiv API 查询参数"""
+    return {
+        'search_query': search_query,
+        'start': 0,
+        'max_results': max_results,
+        'sortBy': 'relevance',
+        'sortOrder': 'descending'
+    }
+
+
+def _arxiv_title_query(title: str) -> str:
+    """精确标题查询；去掉标题内的双引号，避免提前闭合短语"""
+    title = title.replace('"', '')
+    return f'ti:"{title}"'
+
+
+def _arxiv_keywords(title: str) -> str:
+    """去掉停用词和标点，得到关键词搜索用的字符串"""
+    keywords = _STOPWORDS_RE.sub('', title.lower())
+    keywords = _PUNCT_RE.sub(' ', keywords)
+    return ' '.join(keywords.split())
+
+
 def _parse_arxiv_response(xml_content: bytes) -> List[Dict]:
     """解析arXiv API的XML响应"""
     try:
-        root = ET.fromstring(xml_content)
-        namespace = {'atom': 'http://www.w3.org/2005/Atom', 
-                    'arxiv': 'http://arxiv.org/schemas/atom'}
-        
-        entries = root.findall('atom:entry', namespace)
-        results = []
-        
-        for entry in entries:
-            try:
-                # 提取arXiv ID
-                id_url = entry.find('atom:id', namespace).text
-                arxiv_id = id_url.split('/')[-1]
-                if 'v' in arxiv_id:
-                    arxiv_id = arxiv_id.split('v')[0]
-                
-                # 提取标题
-                title_elem = entry.find('atom:title', namespace)
-                title = ' '.join(title_elem.text.strip().split()) if title_elem is not None else ''
-                
-                # 提取作者
-                authors = []
-                for author in entry.findall('atom:author', namespace):
-                    name_elem = author.find('atom:name', namespace)
-                    if name_elem is not None:
-                        authors.append(name_elem.text.strip())
-                
-                # 提取摘要
-                summary_elem = entry.find('atom:summary', namespace)
-                abstract = ' '.join(summary_elem.text.strip().split()) if summary_elem is not None else ''
-                
-                # 提取发布日期
-                published_elem = entry.find('atom:published', namespace)
-                published_date = published_elem.text.strip() if published_elem is not None else ''
-                
-                result = {
-                    'title': title,
-                    'arxiv_id': arxiv_id,
-                    'pdf_url': f"https://arxiv.org/pdf/{arxiv_id}.pdf",
-                    'authors': authors,
-                    'abstract': abstract,
-                    'published_date': published_date
-                }
-                
-                results.append(result)
-                
-            except Exception as e:
-                logger.warning(f"Error parsing arXiv entry: {e}")
-                continue
-        
+        parser = _new_arxiv_parser()
+        results: List[Dict] = []
+        # 分块喂入，每个 <entry> 解析完即释放
+        for start in range(0, len(xml_content), ARXIV_STREAM_CHUNK_SIZE):
+            parser.feed(xml_content[start:start + ARXIV_STREAM_CHUNK_SIZE])
+            _drain_arxiv_entries(parser, results)
+        parser.close()
+        _drain_arxiv_entries(parser, results)
         return results
         
     except Exception as e:
@@ -301,90 +483,67 @@ def _parse_arxiv_response(xml_content: bytes) -> List[Dict]:
         return []
 
 
+def _new_arxiv_parser() -> etree.XMLPullParser:
+    """创建只在 <entry> 结束时产生事件的增量解析器"""
+    return etree.XMLPullParser(events=('end',), tag=_ATOM_ENTRY_TAG)
+
+
+def _drain_arxiv_entries(parser: etree.XMLPullParser, results: List[Dict]) -> None:
+    """取出解析器中已完整的 <entry>，解析后立即释放，不保留整棵 DOM"""
+    for _, entry in parser.read_events():
+        try:
+            result = _parse_arxiv_entry(entry)
+            if result:
+                results.append(result)
+        except Exception as e:
+            logger.warning(f"Error parsing arXiv entry: {e}")
+        finally:
+            entry.clear()
+            while entry.getprevious() is not None:
+                del entry.getparent()[0]
+
+
+def _parse_arxiv_entry(entry) -> Optional[Dict]:
+    """解析单个 arXiv <entry>，缺少 ID 时返回 None"""
+    # 提取arXiv ID
+    id_url = _XP_ID(entry).strip()
+    if not id_url:
+        return None
+    match = _ARXIV_ID_RE.search(id_url)
+    arxiv_id = match.group(1) if match else id_url.rsplit('/', 1)[-1].split('v', 1)[0]
+    
+    # 提取标题
+    title = ' '.join(_XP_TITLE(entry).split())
+    
+    # 提取作者
+    authors = [name.strip() for name in _XP_AUTHORS(entry)]
+    
+    # 提取摘要
+    abstract = ' '.join(_XP_SUMMARY(entry).split())
+    
+    # 提取发布日期
+    published_date = _XP_PUBLISHED(entry).strip()
+    
+    return {
+        'title': title,
+        'arxiv_id': arxiv_id,
+        'pdf_url': f"https://arxiv.org/pdf/{arxiv_id}.pdf",
+        'authors': authors,
+        'abstract': abstract,
+        'published_date': published_date
+    }
+
+
 def _search_openalex(title: str, max_results: int = 10) -> List[Dict]:
     """
     使用OpenAlex API搜索论文
     参考Reference/tools/paper/search_openalex.py中的实现
     """
-    base_url = "https://api.openalex.org/works"
-    
     try:
-        encoded_query = title.replace(' ', '%20')
-        url = f"{base_url}?search={encoded_query}&per-page={min(max_results, 25)}"
-        
-        response = requests.get(url, timeout=30)
+        response = _SESSION.get(OPENALEX_API_URL, params=_openalex_params(title, max_results), timeout=30)
         response.raise_for_status()
         
-        data = response.json()
-        works = data.get('results', [])
-        
-        if not works:
-            return []
-        
-        results = []
-        
-        for work in works:
-            try:
-                # 提取基本信息
-                result = {
-                    'title': work.get('display_name', ''),
-                    'authors': [],
-                    'abstract': work.get('abstract', ''),
-                    'published_date': str(work.get('publication_year', '')),
-                    'arxiv_id': None,
-                    'pdf_url': None
-                }
-                
-                # 提取作者
-                for authorship in work.get('authorships', []):
-                    if authorship and authorship.get('author'):
-                        author_name = authorship['author'].get('display_name')
-                        if author_name:
-                            result['authors'].append(author_name)
-                
-                # 提取arXiv ID
-                arxiv_id = None
-                
-                # 从locations中查找arXiv
-                for location in work.get('locations', []):
-                    if not location:
-                        continue
-                    source = location.get('source')
-                    if source and 'arxiv' in source.get('display_name', '').lower():
-                        pdf_url = location.get('pdf_url', '')
-                        if pdf_url and 'arxiv.org' in pdf_url:
-                            match = re.search(r'arxiv\.org/(?:pdf/|abs/)?(\d+\.\d+)', pdf_url)
-                            if match:
-                                arxiv_id = match.group(1)
-                                break
-                
-                # 从external IDs中查找
-                if not arxiv_id:
-                    external_ids = work.get('ids', {})
-                    if external_ids and 'arxiv' in external_ids:
-                        arxiv_url = external_ids['arxiv']
-                        if arxiv_url:
-                            match = re.search(r'arxiv\.org/(?:abs/|pdf/)?(\d+\.\d+)', arxiv_url)
-                            if match:
-                                arxiv_id = match.group(1)
-                
-                result['arxiv_id'] = arxiv_id
-                
-                # 确定PDF URL
-                if arxiv_id:
-                    result['pdf_url'] = f"https://arxiv.org/pdf/{arxiv_id}.pdf"
-                else:
-                    # 尝试从locations获取PDF
-                    primary_location = work.get('primary_location')
-                    if primary_location and primary_location.get('pdf_url'):
-                        result['pdf_url'] = primary_location['pdf_url']
-                
-                results.append(result)
-                
-            except Exception as e:
-                logger.warning(f"Error processing OpenAlex result: {e}")
-                continue
-        
+        results = _parse_openalex_works(response.json().get('results', []))
         logger.info(f"Found {len(results)} results from OpenAlex")
         return results
         
@@ -393,6 +552,103 @@ def _search_openalex(title: str, max_results: int = 10) -> List[Dict]:
         return []
 
 
+async def _search_openalex_async(
+    session: _ThrottledSession,
+    title: str,
+    max_results: int = 10,
+) -> List[Dict]:
+    """_search_openalex 的异步版本"""
+    try:
+        async with session.get(OPENALEX_API_URL, _openalex_params(title, max_results)) as response:
+            response.raise_for_status()
+            data = await response.json()
+
+        results = _parse_openalex_works(data.get('results', []))
+        logger.info(f"Found {len(results)} results from OpenAlex")
+        return results
+
+    except Exception as e:
+        logger.error(f"Error searching OpenAlex: {e!r}")
+        return []
+
+
+def _openalex_params(title: str, max_results: int) -> Dict:
+    """构造 OpenAlex 查询参数，由 HTTP 客户端负责 URL 编码（标题中可能含 & ? # 等字符）"""
+    return {
+        'search': title,
+        'per-page': min(max_results, 25),
+    }
+
+
+def _parse_openalex_works(works: List[Dict]) -> List[Dict]:
+    """把 OpenAlex 返回的 works 转换为论文信息列表"""
+    results = []
+    
+    for work in works:
+        try:
+            # 提取基本信息
+            result = {
+                'title': work.get('display_name', ''),
+                'authors': [],
+                'abstract': work.get('abstract', ''),
+                'published_date': str(work.get('publication_year', '')),
+                'arxiv_id': None,
+                'pdf_url': None
+            }
+            
+            # 提取作者
+            for authorship in work.get('authorships', []):
+                if authorship and authorship.get('author'):
+                    author_name = authorship['author'].get('display_name')
+                    if author_name:
+                        result['authors'].append(author_name)
+            
+            # 提取arXiv ID
+            arxiv_id = None
+            
+            # 从locations中查找arXiv
+            for location in work.get('locations', []):
+                if not location:
+                    continue
+                source = location.get('source')
+                if source and 'arxiv' in source.get('display_name', '').lower():
+                    pdf_url = location.get('pdf_url', '')
+                    if pdf_url and 'arxiv.org' in pdf_url:
+                        match = _ARXIV_URL_RE.search(pdf_url)
+                        if match:
+                            arxiv_id = match.group(1)
+                            break
+            
+            # 从external IDs中查找
+            if not arxiv_id:
+                external_ids = work.get('ids', {})
+                if external_ids and 'arxiv' in external_ids:
+                    arxiv_url = external_ids['arxiv']
+                    if arxiv_url:
+                        match = _ARXIV_URL_RE.search(arxiv_url)
+                        if match:
+                            arxiv_id = match.group(1)
+            
+            result['arxiv_id'] = arxiv_id
+            
+            # 确定PDF URL
+            if arxiv_id:
+                result['pdf_url'] = f"https://arxiv.org/pdf/{arxiv_id}.pdf"
+            else:
+                # 尝试从locations获取PDF
+                primary_location = work.get('primary_location')
+                if primary_location and primary_location.get('pdf_url'):
+                    result['pdf_url'] = primary_location['pdf_url']
+            
+            results.append(result)
+            
+        except Exception as e:
+            logger.warning(f"Error processing OpenAlex result: {e}")
+            continue
+
+    return results
+
+
 def _extract_from_url(title: str, url: str) -> Optional[Dict]:
     """
     从提供的URL中提取论文信息
@@ -401,16 +657,9 @@ def _extract_from_url(title: str, url: str) -> Optional[Dict]:
     pdf_url = None
     
     # 尝试从URL提取arXiv ID
-    arxiv_patterns = [
-        r'arxiv\.org/abs/(\d+\.\d+)',
-        r'arxiv\.org/pdf/(\d+\.\d+)',
-    ]
-    
-    for pattern in arxiv_patterns:
-        match = re.search(pattern, url)
-        if match:
-            arxiv_id = match.group(1)
-            break
+    match = _ARXIV_URL_RE.search(url)
+    if match:
+        arxiv_id = match.group(1)
     
     if arxiv_id:
         pdf_url = f"https://arxiv.org/pdf/{arxiv_id}.pdf"
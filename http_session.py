@@ -0,0 +1,52 @@
+"""
+共享 HTTP 会话
+为 DBLP / arXiv / OpenAlex 等请求提供统一的连接池、重试和本地响应缓存配置
+"""
+
+from typing import Iterable
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests_cache import CachedSession
+from urllib3.util.retry import Retry
+
+from config import HTTP_CACHE_EXPIRE_AFTER, HTTP_CACHE_PATH
+
+
+def build_cached_session(url_prefixes: Iterable[str]) -> requests.Session:
+    """
+    创建复用连接的 HTTP 会话（keep-alive + 失败重试 + 响应缓存）
+
+    Args:
+        url_prefixes: 挂载连接池和重试策略的 URL 前缀，例如 'https://dblp.org'
+
+    Returns:
+        带本地 SQLite 缓存的会话；请求失败时回退到过期缓存
+    """
+    session = CachedSession(
+        cache_name=str(HTTP_CACHE_PATH),
+        backend="sqlite",
+        urls_expire_after=HTTP_CACHE_EXPIRE_AFTER,
+        allowable_methods=("GET",),
+        stale_if_error=True,
+    )
+    session.headers.update(
+        {
+            "User-Agent": "nona-paper-survey/1.0",
+            "Accept-Encoding": "gzip",
+        }
+    )
+    adapter = HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=20,
+        # 重试耗尽后返回最后一次响应，由调用方 raise_for_status 处理（如转成 RateLimitError）
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=[429, 503],
+            raise_on_status=False,
+        ),
+    )
+    for prefix in url_prefixes:
+        session.mount(prefix, adapter)
+    return session
@@ -58,6 +58,12 @@ def main():
         ]
     else:
         sources = [args.source]
+
+    # 基于 DBLP 的会议彼此独立，先并发收集，下面的循环直接取结果
+    prefetched = {}
+    if args.source == 'all':
+        logger.info("并发收集 CoRL / ICLR / ICML / ICRA / IROS (%s)", args.year)
+        prefetched = collectors.collect_all(args.year)
     
     for source in sources:
         logger.info(f"\n{'='*80}")
@@ -65,7 +71,9 @@ def main():
         logger.info(f"{'='*80}\n")
         
         try:
-            if source == 'arxiv':
+            if source in prefetched:
+                papers = prefetched[source]
+            elif source == 'arxiv':
                 papers = collectors.collect_arxiv_papers(
                     args.year,
                     args.arxiv_category,
@@ -3,11 +3,11 @@
 在数据库中按 title 去重，保留一条代表记录，其余重复记录删除
 
 策略：
-- 先按 title 分组，找到 count > 1 的标题
+- 用窗口函数按 title 分区，一条 SQL 找出所有重复标题
 - 对于每个重复标题：
   - 优先保留 arxiv_id 不为空的记录
   - 在同等条件下，保留 created_at 最早的一条
-  - 其余记录全部删除
+  - 其余记录由一条 DELETE 语句全部删除
 
 默认仅打印（dry-run），需要实际执行删除时加 --apply
 """
@@ -23,77 +23,85 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from config import DB_PATH
 
 
+# 每个标题按保留优先级排序：arxiv_id 非空优先，其次 created_at 早（id 仅用于保证顺序确定）
+RANKED_PAPERS_SQL = """
+    SELECT id, title, arxiv_id, status, created_at,
+           ROW_NUMBER() OVER (
+               PARTITION BY title
+               ORDER BY (arxiv_id IS NOT NULL) DESC, created_at ASC, id ASC
+           ) AS rn,
+           COUNT(*) OVER (PARTITION BY title) AS cnt
+    FROM papers
+"""
+
+
 def deduplicate_titles(apply: bool = False) -> None:
     db_path = str(DB_PATH)
     conn = sqlite3.connect(db_path)
     conn.row_factory = sqlite3.Row
 
+    # 加大页缓存、临时表放内存，让分区扫描留在内存
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-65536")  # 64 MiB page cache
+    if apply:
+        # 实际删除时：WAL + NORMAL 同步避免每次写入都 fsync（journal_mode 会持久化到库文件，预览时不切换）
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+
     print("=" * 80)
     print("标题去重")
     print("=" * 80)
     print(f"数据库: {db_path}")
     print(f"模式: {'实际删除(执行)' if apply else '仅预览(dry-run)'}")
 
-    # 找出所有有重复的标题
-    dup_titles = conn.execute(
-        """
-        SELECT title, COUNT(*) AS cnt
-        FROM papers
-        GROUP BY title
-        HAVING cnt > 1
-        ORDER BY cnt DESC
+    if apply:
+        # 预览与删除在同一个写事务里，保证看到的是同一份数据
+        conn.execute("BEGIN IMMEDIATE")
+
+    # 一次查询取出所有重复标题的记录，rn = 1 为保留的那条
+    records: List[sqlite3.Row] = conn.execute(
+        f"""
+        SELECT * FROM ({RANKED_PAPERS_SQL})
+        WHERE cnt > 1
+        ORDER BY cnt DESC, title, rn
         """
     ).fetchall()
 
-    if not dup_titles:
+    if not records:
         print("未发现重复标题，数据库已是去重状态。")
+        conn.rollback()
         conn.close()
         return
 
-    print(f"发现 {len(dup_titles)} 个存在重复的标题。\n")
-
-    total_deleted = 0
+    dup_title_count = sum(1 for rec in records if rec["rn"] == 1)
+    print(f"发现 {dup_title_count} 个存在重复的标题。\n")
 
-    for row in dup_titles:
-        title = row["title"]
-        cnt = row["cnt"]
-
-        # 取出该标题的所有记录，优先 arxiv_id 非空，其次 created_at 早
-        records: List[sqlite3.Row] = conn.execute(
-            """
-            SELECT *
-            FROM papers
-            WHERE title = ?
-            ORDER BY (arxiv_id IS NOT NULL) DESC, created_at ASC
-            """,
-            (title,),
-        ).fetchall()
-
-        if len(records) <= 1:
-            continue
-
-        keep = records[0]
-        to_delete = records[1:]
-
-        print("-" * 80)
-        print(f"标题: {title!r}  (共 {cnt} 条，保留 1 条，删除 {cnt - 1} 条)")
-        print(
-            f"  保留: id={keep['id']}, arxiv_id={keep['arxiv_id']}, "
-            f"status={keep['status']}, created_at={keep['created_at']}"
-        )
-
-        for rec in to_delete:
+    for rec in records:
+        if rec["rn"] == 1:
+            cnt = rec["cnt"]
+            print("-" * 80)
+            print(f"标题: {rec['title']!r}  (共 {cnt} 条，保留 1 条，删除 {cnt - 1} 条)")
+            print(
+                f"  保留: id={rec['id']}, arxiv_id={rec['arxiv_id']}, "
+                f"status={rec['status']}, created_at={rec['created_at']}"
+            )
+        else:
             print(
                 f"  删除: id={rec['id']}, arxiv_id={rec['arxiv_id']}, "
                 f"status={rec['status']}, created_at={rec['created_at']}"
             )
 
-        if apply:
-            ids = [(rec["id"],) for rec in to_delete]
-            conn.executemany("DELETE FROM papers WHERE id = ?", ids)
-            total_deleted += len(ids)
+    total_deleted = 0
 
-    if apply and total_deleted:
+    if apply:
+        cursor = conn.execute(
+            f"""
+            DELETE FROM papers WHERE id IN (
+                SELECT id FROM ({RANKED_PAPERS_SQL}) WHERE rn > 1
+            )
+            """
+        )
+        total_deleted = cursor.rowcount
         conn.commit()
 
     print("\n" + "=" * 80)
@@ -86,6 +86,19 @@ def test_database():
         assert len(pending_papers) >= 3, "查询结果数量不正确"
         logger.info(f"✓ 状态查询成功: 找到{len(pending_papers)}篇待处理论文")
         
+        # 测试5.1: 多状态合并查询
+        logger.info("\n[测试5.1] 多状态合并查询")
+        multi_papers = db.get_papers_by_statuses(['pendingTitles', 'analyzed'], per_status_limit=2)
+        assert len(multi_papers) == 2, "每个状态应最多返回2篇"
+        assert all(p['status'] == 'pendingTitles' for p in multi_papers), "状态不匹配"
+        assert 'abstract' not in multi_papers[0], "默认不应返回abstract列"
+        try:
+            db.get_papers_by_statuses(['pendingTitles'], per_status_limit=1, columns=['id', 'rn'])
+            assert False, "未知列应被拒绝"
+        except ValueError:
+            pass
+        logger.info(f"✓ 多状态查询成功: 找到{len(multi_papers)}篇论文")
+        
         # 测试6: 更新状态
         logger.info("\n[测试6] 更新论文状态")
         result = db.update_paper_status('2024.12345', 'TobeDownloaded')
@@ -1,9 +1,13 @@
+import html
 import logging
+import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
+from cachetools import TTLCache, cached
 from fastapi import FastAPI, HTTPException
-from fastapi.responses import FileResponse, HTMLResponse
+from fastapi.responses import FileResponse, HTMLResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from fastapi import Request
@@ -17,6 +21,9 @@ BASE_DIR = Path(__file__).parent
 TEMPLATES_DIR = BASE_DIR / "templates"
 STATIC_DIR = BASE_DIR / "static"
 
+# 详情页文本预览的字符数
+TEXT_PREVIEW_CHARS = 5000
+
 app = FastAPI(title="论文管理可视化", version="1.0.0")
 
 templates = Jinja2Templates(directory=str(TEMPLATES_DIR))
@@ -24,25 +31,74 @@ app.mount("/static", StaticFiles(directory=str(STATIC_DIR)), name="static")
 
 db = Database(str(DB_PATH))
 
+# 浏览期间数据基本不变，短时间缓存数据库查询结果
+_status_cache = TTLCache(maxsize=16, ttl=30)
+_stats_cache = TTLCache(maxsize=1, ttl=30)
+_analysis_cache = TTLCache(maxsize=1024, ttl=300)
+
 
 def _get_file_id(paper: Dict) -> str:
     return paper.get("arxiv_id") or paper.get("id")
 
 
-def _load_text(file_id: str) -> Optional[str]:
+@lru_cache(maxsize=128)
+def _read_text_file(path: str, mtime_ns: int, max_chars: int = -1) -> str:
+    """读取文本文件；mtime 作为缓存键的一部分，文件更新后缓存自动失效"""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return f.read(max_chars)
+    except UnicodeDecodeError:
+        with open(path, "r", encoding="latin-1") as f:
+            return f.read(max_chars)
+
+
+def _load_text_preview(file_id: str) -> Optional[str]:
+    """只读取文本开头用于详情页预览，避免每次请求都读入整篇全文"""
+    # TODO: 文本转换流程（processors/pdf_to_text.py）同时写出 <file_id>.preview.txt（即页面展示的预览内容），
+    # 写入前需同步调整按 *.txt 统计/清理文本的脚本
+    preview_path = TEXT_DIR / f"{file_id}.preview.txt"
+    try:
+        st = os.stat(preview_path)
+    except FileNotFoundError:
+        pass
+    else:
+        return _read_text_file(str(preview_path), st.st_mtime_ns)
+
     text_path = TEXT_DIR / f"{file_id}.txt"
-    if text_path.exists():
-        try:
-            with open(text_path, "r", encoding="utf-8") as f:
-                return f.read()
-        except UnicodeDecodeError:
-            with open(text_path, "r", encoding="latin-1") as f:
-                return f.read()
-    return None
+    try:
+        st = os.stat(text_path)
+    except FileNotFoundError:
+        return None
+
+    # 多读一个字符，用来判断是否需要追加省略号
+    head = _read_text_file(str(text_path), st.st_mtime_ns, TEXT_PREVIEW_CHARS + 1)
+    if len(head) > TEXT_PREVIEW_CHARS:
+        return head[:TEXT_PREVIEW_CHARS] + "..."
+    return head
 
 
 def _get_analysis(paper_id: str) -> Optional[Dict]:
-    return db.get_analysis_result(paper_id)
+    """只缓存已有的分析结果：尚未分析的论文不缓存 None，分析完成后能立即看到"""
+    analysis = _analysis_cache.get(paper_id)
+    if analysis is None:
+        analysis = db.get_analysis_result(paper_id)
+        if analysis is not None:
+            _analysis_cache[paper_id] = analysis
+    return analysis
+
+
+@cached(_status_cache)
+def _get_papers_by_statuses(statuses: Tuple[str, ...], limit: int) -> Dict[str, List[Dict]]:
+    """一次查询取出各状态的论文，并按状态分组"""
+    grouped: Dict[str, List[Dict]] = {status: [] for status in statuses}
+    for paper in db.get_papers_by_statuses(list(statuses), limit):
+        grouped[paper["status"]].append(paper)
+    return grouped
+
+
+@cached(_stats_cache)
+def _get_statistics() -> Dict:
+    return db.get_statistics()
 
 
 @app.get("/", response_class=HTMLResponse)
@@ -56,9 +112,11 @@ async def index(request: Request):
         ("downloadFailed", "⚠️ PDF下载失败"),
     ]
 
+    papers_by_status = _get_papers_by_statuses(tuple(key for key, _ in status_sections), 200)
+
     section_data: List[Dict] = []
     for key, label in status_sections:
-        papers = db.get_papers_by_status(key, limit=200)
+        papers = papers_by_status[key]
         section_data.append(
             {
                 "status": key,
@@ -68,7 +126,7 @@ async def index(request: Request):
             }
         )
 
-    stats = db.get_statistics()
+    stats = _get_statistics()
 
     return templates.TemplateResponse(
         "index.html",
@@ -88,8 +146,7 @@ async def paper_detail(paper_id: str, request: Request):
 
     file_id = _get_file_id(paper)
     pdf_path = PDF_DIR / f"{file_id}.pdf"
-    text_content = _load_text(file_id)
-    text_preview = text_content[:5000] + "..." if text_content and len(text_content) > 5000 else text_content
+    text_preview = _load_text_preview(file_id)
     analysis = _get_analysis(paper_id)
 
     return templates.TemplateResponse(
@@ -113,15 +170,22 @@ async def serve_pdf(paper_id: str):
 
     file_id = _get_file_id(paper)
     pdf_path = PDF_DIR / f"{file_id}.pdf"
-    if not pdf_path.exists():
+    # 一次 stat 同时完成存在性检查，并交给 FileResponse 复用，避免重复 stat
+    try:
+        st = os.stat(pdf_path)
+    except FileNotFoundError:
         raise HTTPException(status_code=404, detail="PDF not found")
 
-    headers = {"Content-Disposition": f'inline; filename="{pdf_path.name}"'}
+    headers = {
+        "Content-Disposition": f'inline; filename="{pdf_path.name}"',
+        "ETag": f'"{st.st_mtime_ns:x}-{st.st_size:x}"',
+    }
     return FileResponse(
         path=str(pdf_path),
         media_type="application/pdf",
         filename=pdf_path.name,
         headers=headers,
+        stat_result=st,
     )
 
 
@@ -132,10 +196,19 @@ async def serve_text(paper_id: str):
         raise HTTPException(status_code=404, detail="Paper not found")
 
     file_id = _get_file_id(paper)
-    text_content = _load_text(file_id)
-    if text_content is None:
+    text_path = TEXT_DIR / f"{file_id}.txt"
+    if not text_path.exists():
         raise HTTPException(status_code=404, detail="Text not found")
 
-    return HTMLResponse(text_content.replace("\n", "<br />"))
+    # 逐行转义并输出，不在内存中拼出整篇 HTML
+    def _iter_html_lines():
+        with open(text_path, "r", encoding="utf-8", errors="replace") as f:
+            for line in f:
+                if line.endswith("\n"):
+                    yield html.escape(line[:-1], quote=False) + "<br />"
+                else:
+                    yield html.escape(line, quote=False)
+
+    return StreamingResponse(_iter_html_lines(), media_type="text/html; charset=utf-8")
 
 